@@ -1,8 +1,15 @@
+from functools import lru_cache
+from os import environ
 from typing import List
+from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 from enum import Enum
 
+# .env is read exactly once, at import; repeated Settings construction
+# (tests, reloads) must not re-parse the file
+_DOTENV_LOADED = load_dotenv()
+
 class LogLevel(str, Enum):
     INFO = "info"
     WARN = "warn"
@@ -36,19 +43,17 @@ class Settings(BaseSettings):
     status: StatusConfig = StatusConfig()
     logging: LoggingConfig = LoggingConfig()
 
+    # .env is loaded once at module import by load_dotenv; listing it
+    # here as env_file made pydantic-settings parse the file again on
+    # every Settings construction
     model_config = {
-        'env_file': '.env',
-        'env_file_encoding': 'utf-8',
         'extra': 'ignore',
         'env_nested_delimiter': '__'
     }
 
     @classmethod
+    @lru_cache(maxsize=1)
     def from_env(cls) -> "Settings":
-        from os import environ
-        from dotenv import load_dotenv
-        load_dotenv()
-
         # Map environment variables to nested structure
         return cls(
             discord=DiscordConfig(
@@ -56,11 +61,20 @@ class Settings(BaseSettings):
                 channel_id=environ.get("DISCORD_CHANNEL_ID", ""),
                 check_interval=int(environ.get("CHECK_INTERVAL", "5"))
             ),
-            status=StatusConfig(),
             logging=LoggingConfig(
                 level=LogLevel(environ.get("LOG_LEVEL", "info").lower())
             )
         )
 
-# Create a global config instance
-config = Settings.from_env()
\ No newline at end of file
+def __getattr__(name: str):
+    """Build the global config lazily on first access.
+
+    Keeps `from config import config` working while deferring pydantic
+    validation until something actually needs settings (.env itself is
+    loaded at module import above).
+    """
+    if name == "config":
+        value = Settings.from_env()
+        globals()["config"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
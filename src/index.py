@@ -1,91 +1,233 @@
 import asyncio
+import signal
+import time
 from typing import Optional, Dict, Any
+import aiohttp
 import discord
-from discord.ext import tasks
-from datetime import datetime, timedelta
 import logger
 from config import config
 from status_checker import StatusChecker
-from utils.embed_utils import create_status_embed, create_incident_embed
+from utils.embed_utils import (create_status_embed, create_incident_embed,
+                               create_change_digest_embed)
+from utils.state_store import StateStore
+
+def _status_signature(state: Dict[str, Any]) -> tuple:
+    """Compress a status state into a hashable tuple for change detection.
+
+    Tuple equality compares at C level, so the per-tick "anything
+    changed?" check costs no Python-level iteration and no JSON dump.
+    """
+    overall = state.get('overall', {})
+    return (
+        overall.get('level'),
+        overall.get('description'),
+        tuple(sorted(
+            (name, data['status'])
+            for name, data in state.get('components', {}).items()
+        ))
+    )
+
+class _TokenBucket:
+    """Token bucket on the monotonic clock for pacing Discord sends.
+
+    Unlike the previous wall-clock gap check, monotonic time is immune
+    to NTP steps, and the burst allowance lets a handful of messages go
+    out back-to-back before pacing kicks in.
+    """
+
+    def __init__(self, rate: float = 1.0, burst: int = 5):
+        self.rate = rate  # tokens refilled per second
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+
+    async def consume(self, tokens: float = 1.0) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst,
+                           self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        if self._tokens < tokens:
+            await asyncio.sleep((tokens - self._tokens) / self.rate)
+        self._tokens -= tokens
 
 class AnthropicStatusBot(discord.Client):
     def __init__(self):
         super().__init__(intents=discord.Intents.default())
-        self.status_checker = StatusChecker()
+        # One combined state file shared with the checker, so message id
+        # and last status persist in a single atomic write
+        self._state_store = StateStore()
+        self.status_checker = StatusChecker(store=self._state_store)
+        # One keep-alive HTTP session for every status poll; created in
+        # setup_hook once the event loop is running
+        self.http_session: Optional[aiohttp.ClientSession] = None
+        self._check_task: Optional[asyncio.Task] = None
+        # Fetch/diff (producer) and Discord dispatch (consumer) are
+        # decoupled through this queue so a slow send never delays the
+        # next poll; the bound gives natural backpressure
+        self._updates_q: asyncio.Queue = asyncio.Queue(maxsize=32)
+        self._dispatch_task: Optional[asyncio.Task] = None
+        # Message handles are cached as PartialMessage objects so edits
+        # go straight to PATCH with no lookup; incident messages are
+        # keyed by incident id so later updates edit in place
         self.state = {
-            'status_message_id': None,
-            'last_message_time': 0
+            'status_message': None,
+            'incident_messages': {}
         }
         self.RATE_LIMIT_DELAY = 1.0  # 1 second between messages
+        # Adaptive inter-send delay (AIMD): doubled on a 429, walked back
+        # additively on success, never below RATE_LIMIT_DELAY. The token
+        # bucket's refill rate tracks it
+        self._send_delay = self.RATE_LIMIT_DELAY
+        self._bucket = _TokenBucket(rate=1.0 / self.RATE_LIMIT_DELAY, burst=5)
+        self._MAX_SEND_DELAY = 30.0
+        self._SEND_DELAY_DECAY = 0.25
+        # Status/component change notices are buffered and flushed as one
+        # digest embed at most every _NOTIFY_INTERVAL seconds, so a burst
+        # of K changes costs one send instead of K
+        self._pending_changes: list = []
+        self._last_notify = 0.0
+        self._NOTIFY_INTERVAL = 30.0
+        # channel_id is a fixed string setting; parse it once
+        self._channel_id = int(config.discord.channel_id)
+        # Signature of the last state successfully rendered to Discord;
+        # lets unchanged ticks skip embed construction and the edit call
+        self._last_rendered_state: Optional[tuple] = None
+        # The store is consulted exactly once for the message id; the
+        # flag keeps it from being re-read on every reconnect
+        self._message_id_loaded = False
+        # Permissions needed in the status channel, kept as one bitmask so
+        # the startup check is a single AND instead of per-attribute getattr
+        self._required_permissions = discord.Permissions(
+            view_channel=True,
+            send_messages=True,
+            manage_messages=True,
+            embed_links=True,
+            read_message_history=True
+        )
 
     async def setup_hook(self) -> None:
         """Set up the bot and start the status check loop."""
-        self.check_status.start()
-
-    async def update_message(self, channel: discord.TextChannel, 
-                           message_id: Optional[int], embed: discord.Embed) -> Optional[int]:
-        """Update or send a message with rate limiting."""
-        # Rate limiting
-        now = datetime.now().timestamp()
-        time_since_last = now - self.state['last_message_time']
-        if time_since_last < self.RATE_LIMIT_DELAY:
-            await asyncio.sleep(self.RATE_LIMIT_DELAY - time_since_last)
-        self.state['last_message_time'] = datetime.now().timestamp()
+        self.http_session = aiohttp.ClientSession(
+            # A tiny keep-alive pool with cached DNS: reconnects reuse
+            # the resolved address instead of re-resolving per fetch
+            connector=aiohttp.TCPConnector(limit=4, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=config.status.timeout / 1000),
+            headers={'User-Agent': config.status.user_agent}
+        )
+        self.status_checker.session = self.http_session
+        self._check_task = asyncio.create_task(self._run_check_loop())
+        self._dispatch_task = asyncio.create_task(self._dispatch_loop())
+
+    async def _get_status_channel(self) -> Optional[discord.abc.Messageable]:
+        """Resolve the status channel, preferring the gateway cache.
+
+        get_channel is a synchronous cache lookup; the REST fetch_channel
+        round trip only happens if the cache misses (e.g. before ready).
+        """
+        channel = self.get_channel(self._channel_id)
+        if channel is None:
+            channel = await self.fetch_channel(self._channel_id)
+        return channel
+
+    def _record_send_result(self, rate_limited: bool) -> None:
+        """Adjust the adaptive send delay (multiplicative up, additive down)."""
+        if rate_limited:
+            self._send_delay = min(self._send_delay * 2, self._MAX_SEND_DELAY)
+            logger.warn(f"Rate limited; send delay raised to {self._send_delay}s")
+        elif self._send_delay > self.RATE_LIMIT_DELAY:
+            self._send_delay = max(self.RATE_LIMIT_DELAY,
+                                   self._send_delay - self._SEND_DELAY_DECAY)
+        self._bucket.rate = 1.0 / self._send_delay
 
+    async def _upsert_incident_message(self, channel: discord.TextChannel,
+                                       incident: Dict[str, Any]) -> None:
+        """Edit the tracked message for an incident, or send and track one.
+
+        Keeping one message per incident lets follow-up updates PATCH in
+        place instead of posting a new message per tick.
+        """
+        embed = create_incident_embed(incident)
+        messages = self.state['incident_messages']
+        message = messages.get(incident['id'])
+        await self._bucket.consume()
         try:
-            if message_id:
+            if message is not None:
                 try:
-                    message = await channel.fetch_message(message_id)
                     await message.edit(embed=embed)
-                    logger.info(f"Successfully edited message {message_id}")
-                    return message_id
+                    self._record_send_result(False)
+                except (discord.NotFound, discord.Forbidden):
+                    message = None
+            if message is None:
+                message = await channel.send(embed=embed)
+                self._record_send_result(False)
+
+            if incident.get('status') == 'resolved':
+                # No further edits are coming; stop tracking it
+                messages.pop(incident['id'], None)
+            else:
+                messages[incident['id']] = message
+        except discord.HTTPException as error:
+            self._record_send_result(error.status == 429)
+            logger.log_error(error, {'operation': 'upsert_incident_message'})
+
+    async def update_message(self, channel: discord.TextChannel,
+                           message: Optional[discord.PartialMessage],
+                           embed: discord.Embed) -> Optional[discord.Message]:
+        """Update or send the status message with rate limiting."""
+        await self._bucket.consume()
+
+        try:
+            if message is not None:
+                try:
+                    # PartialMessage edits skip the fetch GET and go
+                    # straight to PATCH; NotFound surfaces from the edit
+                    await message.edit(embed=embed)
+                    logger.debug("Successfully edited message %s", message.id)
+                    self._record_send_result(False)
+                    return message
                 except (discord.NotFound, discord.Forbidden) as error:
-                    # If message not found or can't be edited, create new one
+                    # If message not found or can't be edited, create new
+                    # one; best-effort unpin of the stale message first
                     logger.warn(f"Failed to edit message: {error}")
+                    try:
+                        await message.unpin()
+                    except discord.HTTPException:
+                        pass
                     message = await channel.send(embed=embed)
                     try:
                         await message.pin(reason="Status message pinned for visibility")
                         logger.info(f"Successfully pinned new message {message.id} (after failed edit)")
                     except discord.Forbidden:
                         logger.warn("Failed to pin message: Missing permissions")
-                    return message.id
+                    self._record_send_result(False)
+                    return message
             
             # Send new message and pin it
             logger.info("Creating new status message...")
             message = await channel.send(embed=embed)
             try:
-                # Unpin old status messages from the bot
-                pins = await channel.pins()
-                for pin in pins:
-                    if pin.author == self.user and pin.embeds:
-                        await pin.unpin()
-                        logger.info(f"Unpinned old status message: {pin.id}")
-                
-                # Pin the new message
+                # Pin the new message; old pins are cleaned up via the
+                # tracked handle, never by enumerating channel.pins()
                 await message.pin(reason="Status message pinned for visibility")
                 logger.info(f"Successfully pinned new status message {message.id}")
             except discord.Forbidden:
                 logger.warn("Failed to pin message: Missing permissions")
-            return message.id
+            self._record_send_result(False)
+            return message
         except Exception as error:
+            if isinstance(error, discord.HTTPException) and error.status == 429:
+                self._record_send_result(True)
             logger.log_error(error, {'operation': 'update_message'})
             # Last resort: try to send a new message
             try:
                 message = await channel.send(embed=embed)
                 try:
-                    # Unpin old status messages from the bot (fallback case)
-                    pins = await channel.pins()
-                    for pin in pins:
-                        if pin.author == self.user and pin.embeds:
-                            await pin.unpin()
-                            logger.info(f"Unpinned old status message in fallback: {pin.id}")
-                    
                     # Pin the new message
                     await message.pin(reason="Status message pinned for visibility")
                     logger.info(f"Successfully pinned new message in fallback: {message.id}")
                 except discord.Forbidden:
                     logger.warn("Failed to pin message: Missing permissions")
-                return message.id
+                return message
             except Exception as final_error:
                 logger.log_error(final_error, {'operation': 'update_message_fallback'})
                 return None
@@ -94,68 +236,179 @@ class AnthropicStatusBot(discord.Client):
                                  updates: Optional[Dict[str, Any]]) -> None:
         """Handle status updates and send/update Discord messages."""
         try:
-            channel = await self.fetch_channel(int(config.discord.channel_id))
+            # Skip the render and the Discord round trip when the state is
+            # identical to what the status message already shows
+            state_key = _status_signature(current_state)
+            if (not updates and not self._pending_changes
+                    and state_key == self._last_rendered_state
+                    and self.state['status_message'] is not None):
+                logger.debug("Status unchanged; skipping message update")
+                return
+
+            channel = await self._get_status_channel()
             if not channel:
                 return
 
             # Update status message
-            logger.info(f"Updating status message (current ID: {self.state['status_message_id']})")
-            new_message_id = await self.update_message(
+            old_message = self.state['status_message']
+            old_id = old_message.id if old_message is not None else None
+            logger.debug("Updating status message (current ID: %s)", old_id)
+            new_message = await self.update_message(
                 channel,
-                self.state['status_message_id'],
+                old_message,
                 create_status_embed(current_state)
             )
-            if new_message_id != self.state['status_message_id']:
-                logger.info(f"Status message ID changed: {self.state['status_message_id']} -> {new_message_id}")
-            self.state['status_message_id'] = new_message_id
+            new_id = new_message.id if new_message is not None else None
+            if new_id != old_id:
+                logger.info(f"Status message ID changed: {old_id} -> {new_id}")
+                # Store writes hit disk; run them off the event loop
+                await asyncio.to_thread(
+                    self._state_store.set, 'message_id', new_id,
+                    force=True
+                )
+            self.state['status_message'] = new_message
+            if new_message is not None:
+                self._last_rendered_state = state_key
+
+            # Edit tracked incident messages in place; send new ones.
+            # Dispatched concurrently so N incidents take ~one round trip
+            # of latency, with the token bucket still pacing the sends
+            if updates:
+                # Coalesce multiple events for the same incident within a
+                # tick: only the last one renders, so only it is sent
+                latest = {}
+                for update in updates:
+                    if update.get('type') in ('new_incident', 'incident_update', 'incident_resolved'):
+                        latest[update['incident']['id']] = update['incident']
+                if latest:
+                    results = await asyncio.gather(
+                        *(self._upsert_incident_message(channel, incident)
+                          for incident in latest.values()),
+                        return_exceptions=True
+                    )
+                    for result in results:
+                        if isinstance(result, Exception):
+                            logger.log_error(result, {'operation': 'upsert_incident_message'})
+
+                # Buffer change notices for the coalesced digest below
+                self._pending_changes.extend(
+                    update for update in updates
+                    if update.get('type') in ('status_change', 'component_update')
+                )
+
+            # Flush buffered changes as one digest embed per interval
+            now = time.monotonic()
+            if (self._pending_changes
+                    and now - self._last_notify >= self._NOTIFY_INTERVAL):
+                await channel.send(
+                    embed=create_change_digest_embed(self._pending_changes)
+                )
+                self._pending_changes.clear()
+                self._last_notify = now
 
         except Exception as error:
             logger.log_error(error, {'operation': 'handle_status_update'})
 
-    @tasks.loop(minutes=config.discord.check_interval)
+    async def _run_check_loop(self) -> None:
+        """Run status checks on a fixed deadline grid.
+
+        tasks.loop schedules the next run one interval after the prior
+        one finishes, so slow fetches progressively shift the cadence.
+        Advancing an absolute deadline and sleeping the remainder keeps
+        the checks anchored, whatever each one costs.
+        """
+        await self.wait_until_ready()
+        loop = asyncio.get_running_loop()
+        interval = config.discord.check_interval * 60
+        deadline = loop.time()
+        while not self.is_closed():
+            await self.check_status()
+            deadline += interval
+            now = loop.time()
+            if deadline < now:
+                # A check overran the whole interval; re-anchor rather
+                # than firing back-to-back catch-up runs
+                deadline = now
+            await asyncio.sleep(deadline - now)
+
     async def check_status(self):
         """Periodic status check task."""
         try:
-            logger.info("Starting status check cycle...")
+            logger.debug("Starting status check cycle...")
             updates = await self.status_checker.check_for_updates()
             
             if updates:
-                logger.info(f"Received {len(updates)} updates")
+                logger.debug("Received %d updates", len(updates))
                 for update in updates:
-                    logger.info(f"Processing update type: {update.get('type', 'unknown')}")
+                    logger.debug("Processing update type: %s", update.get('type', 'unknown'))
             
-            await self.handle_status_update(
-                self.status_checker.get_current_state(),
-                updates
-            )
-            logger.info("Status check cycle completed")
+            # Hand off to the dispatch consumer; the next fetch is not
+            # held up by Discord sends
+            state = self.status_checker.get_current_state()
+            if state is not None:
+                await self._updates_q.put((state, updates))
+            logger.debug("Status check cycle completed")
         except Exception as error:
             logger.log_error(error, {'operation': 'check_status'})
 
+    async def _dispatch_loop(self) -> None:
+        """Drain queued update batches and send them to Discord."""
+        while True:
+            state, updates = await self._updates_q.get()
+            try:
+                await self.handle_status_update(state, updates)
+            finally:
+                self._updates_q.task_done()
+
     async def close(self) -> None:
         """Clean up resources on shutdown."""
-        self.check_status.cancel()
+        if self._check_task is not None:
+            self._check_task.cancel()
+        if self._dispatch_task is not None:
+            self._dispatch_task.cancel()
+        await asyncio.to_thread(self.status_checker.flush_state)
+        if self.http_session is not None:
+            await self.http_session.close()
         await super().close()
 
     async def on_ready(self):
         """Handle bot ready event."""
         logger.info(f"Bot ready as {self.user}")
-        
-        # Find existing pinned status message
+
+        channel = None
         try:
-            channel = await self.fetch_channel(int(config.discord.channel_id))
-            if channel:
-                pins = await channel.pins()
-                # Look for the most recent pinned message from the bot
-                for pin in pins:
-                    if pin.author == self.user and pin.embeds:
-                        self.state['status_message_id'] = pin.id
-                        logger.info(f"Found existing pinned status message: {pin.id}")
-                        break
+            channel = await self._get_status_channel()
+            if isinstance(channel, discord.TextChannel):
+                permissions = channel.permissions_for(channel.guild.me)
+                missing = self._required_permissions.value & ~permissions.value
+                if missing:
+                    # Decode the bitmask to names only on this cold path
+                    names = [name for name, value in discord.Permissions(missing) if value]
+                    logger.warn(f"Missing channel permissions: {', '.join(names)}")
         except Exception as error:
-            logger.log_error(error, {'operation': 'find_pinned_message'})
-        
-        await self.check_status()
+            logger.log_error(error, {'operation': 'check_permissions'})
+
+        # Restore the persisted message id once as a PartialMessage; fall
+        # back to scanning the channel pins only when nothing was persisted
+        if not self._message_id_loaded:
+            self._message_id_loaded = True
+            message_id = self._state_store.get('message_id')
+            if message_id and channel is not None:
+                self.state['status_message'] = channel.get_partial_message(message_id)
+                logger.info(f"Restored status message id: {message_id}")
+
+        if self.state['status_message'] is None:
+            try:
+                if channel:
+                    pins = await channel.pins()
+                    # Look for the most recent pinned message from the bot
+                    for pin in pins:
+                        if pin.author == self.user and pin.embeds:
+                            self.state['status_message'] = pin
+                            logger.info(f"Found existing pinned status message: {pin.id}")
+                            break
+            except Exception as error:
+                logger.log_error(error, {'operation': 'find_pinned_message'})
 
     async def on_error(self, event: str, *args, **kwargs):
         """Handle Discord events errors."""
@@ -169,6 +422,19 @@ def main():
     bot = AnthropicStatusBot()
     
     async def start():
+        # Handle SIGINT/SIGTERM inside the loop so close() runs to
+        # completion (flushing persisted state) before the process exits
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(
+                    sig, lambda: asyncio.create_task(bot.close())
+                )
+            except NotImplementedError:
+                # add_signal_handler is unavailable on Windows loops;
+                # fall back to the KeyboardInterrupt path below
+                pass
+
         try:
             await bot.start(config.discord.token)
         except KeyboardInterrupt:
@@ -176,7 +442,8 @@ def main():
         except Exception as error:
             logger.log_error(error, {'operation': 'startup'})
         finally:
-            await bot.close()
+            if not bot.is_closed():
+                await bot.close()
 
     # Run the bot
     asyncio.run(start())
\ No newline at end of file
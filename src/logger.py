@@ -1,6 +1,5 @@
 import logging
 import sys
-from datetime import datetime
 from typing import Any, Dict, Optional
 from config import config
 
@@ -26,18 +25,15 @@ def log_request(method: str, url: str, duration: float, status: int) -> None:
     )
 
 def log_error(error: Exception, context: Optional[Dict[str, Any]] = None) -> None:
-    """Log error with context."""
-    error_details = {
-        'error': str(error),
-        'type': error.__class__.__name__,
-        'timestamp': datetime.utcnow().isoformat(),
-        **(context or {})
-    }
-    
+    """Log error with context.
+
+    The formatter's %(asctime)s supplies the timestamp and exc_info the
+    traceback, so no per-call dict or ISO string is built.
+    """
     logger.error(
-        f"Error in {context.get('operation', 'unknown_operation') if context else 'unknown_operation'}: "
-        f"{error_details['error']}",
-        extra={'error_details': error_details},
+        "Error in %s: %s",
+        (context or {}).get('operation', 'unknown_operation'),
+        error,
         exc_info=True
     )
 
@@ -1,196 +1,366 @@
-from typing import Dict, List, Optional, Any, Set
+import asyncio
+import hashlib
+import re
+from collections import OrderedDict
+import sys
+import time
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Any, Union
 from datetime import datetime
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
 from tenacity import retry, stop_after_attempt, wait_exponential
 from config import config
+from utils.state_store import StateStore
 import logging
 
 logger = logging.getLogger(__name__)
 
+# ISO "now" cached at second granularity: several parse paths stamp the
+# same instant, and one strftime-equivalent per second is plenty
+_cached_now = (0, '')
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO string, cached per whole second."""
+    global _cached_now
+    t = int(time.time())
+    if t != _cached_now[0]:
+        _cached_now = (t, datetime.utcfromtimestamp(t).isoformat())
+    return _cached_now[1]
+
+# Status page timestamps always follow this shape ("November 28, 2024 4:47 PM")
+_TIMESTAMP_FORMAT = "%B %d, %Y %I:%M %p"
+
+# Tokenizes a full update date in one scan: month, day, year, time
+_DATE_RE = re.compile(r'(\w+)\s+(\d{1,2}),?\s+(\d{4})\s+(\d{1,2}):(\d{2})\s*([AP]M)')
+
+# Class-token → level tables for the overall status and incident impact;
+# built once so the per-element work is a dict hit per token
+_STATUS_LEVEL_BY_TOKEN = {
+    'degraded': 'degraded',
+    'outage': 'outage',
+    'maintenance': 'maintenance'
+}
+
+_IMPACT_BY_TOKEN = {
+    'impact-minor': 'minor',
+    'impact-major': 'major',
+    'impact-critical': 'critical'
+}
+
+_MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12
+}
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp_cached(timestamp_str: str) -> str:
+    """Parse a status page timestamp, memoized on the raw string.
+
+    Identical timestamps repeat across incident updates within a page,
+    so repeats become a dict hit instead of a full parse. The regex +
+    month-table path builds the datetime directly, skipping strptime's
+    per-call format interpretation; strptime remains as the fallback
+    for anything the regex does not recognize. Errors are left to the
+    caller so failures are not cached.
+    """
+    match = _DATE_RE.search(timestamp_str)
+    if match:
+        month = _MONTHS.get(match.group(1).lower())
+        if month:
+            hour = int(match.group(4)) % 12
+            if match.group(6) == 'PM':
+                hour += 12
+            return datetime(
+                int(match.group(3)), month, int(match.group(2)),
+                hour, int(match.group(5))
+            ).isoformat()
+    return datetime.strptime(timestamp_str, _TIMESTAMP_FORMAT).isoformat()
+
 class StatusChecker:
-    def __init__(self):
-        self._previous_state: Optional[Dict[str, Any]] = None
+    # No per-instance __dict__: attribute access goes through slot
+    # descriptors, and the fixed attribute set is documented in one place
+    __slots__ = ('_current_state', '_components', '_recent_messages',
+                 '_body_hash', '_last_parse', '_etag', '_last_modified',
+                 '_store', '_previous_state', 'session')
+
+    # Selectors compiled once at class definition and shared by every
+    # instance; flat attributes avoid nested dict hits on the hot path
+    _SEL_OVERALL_STATUS = CSSSelector('.overall-status')
+    _SEL_OVERALL_DESCRIPTION = CSSSelector('.overall-status__description')
+    _SEL_COMPONENT_CONTAINER = CSSSelector('.component-container')
+    _SEL_COMPONENT_NAME = CSSSelector('.name')
+    _SEL_COMPONENT_STATUS = CSSSelector('.component-status')
+    _SEL_STATUS_DAY = CSSSelector('.status-day')
+    _SEL_INCIDENT_CONTAINER = CSSSelector('.incident-container')
+    _SEL_INCIDENT_TITLE = CSSSelector('.incident-title')
+    _SEL_INCIDENT_UPDATE = CSSSelector('.update')
+    _SEL_INCIDENT_MESSAGE = CSSSelector('.whitespace-pre-wrap')
+    _SEL_DATE_DAY = CSSSelector('var[data-var="date"]')
+    _SEL_DATE_TIME = CSSSelector('var[data-var="time"]')
+    _SEL_DATE_YEAR = CSSSelector('var[data-var="year"]')
+
+    # Sent with every status page request
+    _REQUEST_HEADERS = {
+        'Accept': 'text/html',
+        'Cache-Control': 'max-age=60'
+    }
+
+    # Duplicate-suppression bounds; class-level so they need no slot
+    _MESSAGE_EXPIRY = 60.0  # seconds
+    _MAX_RECENT_MESSAGES = 1000
+
+    def __init__(self, store: Optional[StateStore] = None,
+                 session: Optional[aiohttp.ClientSession] = None):
         self._current_state: Optional[Dict[str, Any]] = None
-        self._components: Set[str] = set(config.status.components)
-        self._recent_messages: Dict[str, float] = {}
-        self._MESSAGE_EXPIRY = 60000  # 1 minute in milliseconds
-
-        # HTML selectors for parsing
-        self._selectors = {
-            'overall': {
-                'description': '.overall-status__description',
-                'status': '.overall-status'
-            },
-            'component': {
-                'container': '.component-container',
-                'name': '.name',
-                'status': '.component-status'
-            },
-            'incident': {
-                'container': '.incident-container',
-                'title': '.incident-title',
-                'update': '.update',
-                'message': '.whitespace-pre-wrap',
-                'date': {
-                    'day': 'var[data-var="date"]',
-                    'time': 'var[data-var="time"]',
-                    'year': 'var[data-var="year"]'
-                }
-            }
-        }
+        self._components: FrozenSet[str] = frozenset(config.status.components)
+        # LRU of recently seen messages: OrderedDict gives O(1) eviction
+        # of the oldest entry instead of a min() scan
+        self._recent_messages: 'OrderedDict[str, float]' = OrderedDict()
+
+        # Content hash of the last fetched page plus its parsed state, so
+        # unchanged polls skip the DOM walk entirely
+        self._body_hash: Optional[bytes] = None
+        self._last_parse: Optional[Dict[str, Any]] = None
+
+        # Validators from the last 200 response; echoed back so the
+        # server can answer an unchanged poll with a bodyless 304
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+
+        # Previous state is persisted (in the combined state file shared
+        # with the bot) so restarts resume diffing instead of
+        # re-announcing the current status
+        self._store = store if store is not None else StateStore()
+        self._previous_state: Optional[Dict[str, Any]] = self._store.get('last_status')
 
-        # Configure requests session
-        self._session = requests.Session()
-        self._session.headers.update({
-            'Accept': 'text/html',
-            'User-Agent': config.status.user_agent,
-            'Cache-Control': 'max-age=60'
-        })
+        # HTTP session is shared with (and owned by) the bot so one
+        # keep-alive connection serves every poll; created lazily when
+        # the checker runs standalone
+        self.session = session
 
     @retry(
         stop=stop_after_attempt(config.status.retries),
         wait=wait_exponential(multiplier=1, min=4, max=10),
         retry_error_callback=lambda retry_state: None
     )
-    def fetch_status(self) -> Optional[Dict[str, Any]]:
+    async def fetch_status(self) -> Optional[Dict[str, Any]]:
         """Fetch and parse the status page."""
         try:
-            start_time = datetime.now()
-            response = self._session.get(
+            if self.session is None:
+                self.session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=4, ttl_dns_cache=300),
+                    timeout=aiohttp.ClientTimeout(
+                        total=config.status.timeout / 1000  # Convert to seconds
+                    ),
+                    headers={'User-Agent': config.status.user_agent}
+                )
+
+            headers = dict(self._REQUEST_HEADERS)
+            if self._etag:
+                headers['If-None-Match'] = self._etag
+            if self._last_modified:
+                headers['If-Modified-Since'] = self._last_modified
+
+            start_ns = time.perf_counter_ns()
+            async with self.session.get(
                 config.status.url,
-                timeout=config.status.timeout / 1000  # Convert to seconds
-            )
-            duration = (datetime.now() - start_time).total_seconds() * 1000
-
-            logger.info(f"GET {config.status.url} - {response.status_code} - {duration}ms")
-            
-            soup = BeautifulSoup(response.text, 'lxml')
-            
-            return {
-                'overall': self._parse_overall_status(soup),
-                'components': self._parse_components(soup),
-                'incidents': self._parse_incidents(soup),
-                'timestamp': datetime.utcnow().isoformat()
-            }
+                headers=headers
+            ) as response:
+                body = await response.read()
+                status_code = response.status
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+            duration = (time.perf_counter_ns() - start_ns) / 1e6
+
+            logger.debug("GET %s - %s - %sms", config.status.url, status_code, duration)
+
+            # 304: page unchanged, skip download and parse entirely
+            if status_code == 304 and self._last_parse is not None:
+                return self._last_parse
+
+            self._etag = etag
+            self._last_modified = last_modified
+
+            # Most polls return byte-identical HTML; hashing is far cheaper
+            # than re-parsing the DOM
+            digest = hashlib.blake2b(body, digest_size=16).digest()
+            if digest == self._body_hash and self._last_parse is not None:
+                return self._last_parse
+
+            # The DOM walk is CPU-bound; keep it off the event loop.
+            # Raw bytes go straight to lxml, which sniffs the encoding
+            # itself — no interim str allocation for the whole page
+            state = await asyncio.to_thread(self.parse, body)
+            self._body_hash = digest
+            self._last_parse = state
+            return state
         except Exception as error:
             logger.error(f"Error fetching status: {str(error)}", exc_info=True)
             return None
 
-    def _parse_overall_status(self, soup: BeautifulSoup) -> Dict[str, str]:
-        """Parse overall system status."""
-        status_elem = soup.select_one(self._selectors['overall']['status'])
-        description_elem = soup.select_one(self._selectors['overall']['description'])
-        
+    def parse(self, html: Union[str, bytes]) -> Dict[str, Any]:
+        """Parse raw status page HTML into a state dict.
+
+        Accepts bytes straight off the wire (lxml handles the encoding)
+        or an already-decoded string. Single entry point so the document
+        is built exactly once and shared by the overall/component/incident
+        passes.
+        """
+        document = lxml_html.fromstring(html)
         return {
-            'description': description_elem.text.strip() if description_elem else 'All Systems Operational',
-            'level': self._determine_status_level(status_elem.get('class', []) if status_elem else [])
+            'overall': self._parse_overall_status(document),
+            'components': self._parse_components(document),
+            'incidents': self._parse_incidents(document),
+            'timestamp': _now_iso()
         }
 
-    def _determine_status_level(self, status_classes: List[str]) -> str:
-        """Determine status level from CSS classes."""
-        status_map = {
-            'degraded': 'degraded',
-            'outage': 'outage',
-            'maintenance': 'maintenance'
+    def _parse_overall_status(self, document: lxml_html.HtmlElement) -> Dict[str, str]:
+        """Parse overall system status."""
+        status_elems = self._SEL_OVERALL_STATUS(document)
+        description_elems = self._SEL_OVERALL_DESCRIPTION(document)
+
+        return {
+            'description': description_elems[0].text_content().strip() if description_elems else 'All Systems Operational',
+            'level': self._determine_status_level(status_elems[0].get('class') or '' if status_elems else '')
         }
-        
-        status_class = ' '.join(status_classes).lower()
-        return next((level for key, level in status_map.items() 
-                    if key in status_class), 'operational')
 
-    def _parse_components(self, soup: BeautifulSoup) -> Dict[str, Dict[str, str]]:
+    def _determine_status_level(self, status_class: str) -> str:
+        """Determine status level from the CSS class attribute."""
+        # Hash lookups on the class tokens (with the dash-suffix covering
+        # BEM-style "status--degraded" variants) instead of substring
+        # scans over the re-joined attribute
+        for token in status_class.lower().split():
+            level = (_STATUS_LEVEL_BY_TOKEN.get(token)
+                     or _STATUS_LEVEL_BY_TOKEN.get(token.rsplit('-', 1)[-1]))
+            if level:
+                return level
+        return 'operational'
+
+    def _parse_components(self, document: lxml_html.HtmlElement) -> Dict[str, Dict[str, str]]:
         """Parse component statuses."""
         components = {}
-        timestamp = datetime.utcnow().isoformat()
-        
-        for elem in soup.select(self._selectors['component']['container']):
-            name = elem.select_one(self._selectors['component']['name'])
-            if name:
-                name_text = name.text.strip()
-                if name_text in self._components:
-                    status = elem.select_one(self._selectors['component']['status'])
+        timestamp = _now_iso()
+
+        # Bind selectors and the component set to locals for the loop
+        name_sel = self._SEL_COMPONENT_NAME
+        status_sel = self._SEL_COMPONENT_STATUS
+        components_filter = self._components
+
+        for elem in self._SEL_COMPONENT_CONTAINER(document):
+            names = name_sel(elem)
+            if names:
+                name_text = names[0].text_content().strip()
+                if name_text in components_filter:
+                    statuses = status_sel(elem)
                     components[name_text] = {
-                        'status': status.text.strip() if status else 'unknown',
+                        # Interned: the same few status strings recur across
+                        # components and polls, and downstream comparisons
+                        # reduce to pointer checks
+                        'status': sys.intern(statuses[0].text_content().strip()) if statuses else 'unknown',
                         'timestamp': timestamp
                     }
-        
+
         return components
 
-    def _parse_incidents(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _parse_incidents(self, document: lxml_html.HtmlElement) -> List[Dict[str, Any]]:
         """Parse incident information."""
         incidents = []
-        
-        for day_elem in soup.select('.status-day'):
-            for incident_elem in day_elem.select(self._selectors['incident']['container']):
+
+        incident_sel = self._SEL_INCIDENT_CONTAINER
+        for day_elem in self._SEL_STATUS_DAY(document):
+            for incident_elem in incident_sel(day_elem):
                 incidents.append(self._parse_incident_element(incident_elem))
-        
+
         return incidents
 
-    def _parse_incident_element(self, incident_elem: BeautifulSoup) -> Dict[str, Any]:
+    def _parse_incident_element(self, incident_elem: lxml_html.HtmlElement) -> Dict[str, Any]:
         """Parse a single incident element."""
-        title_elem = incident_elem.select_one(self._selectors['incident']['title'])
-        link = title_elem.find('a') if title_elem else None
-        
+        title_elems = self._SEL_INCIDENT_TITLE(incident_elem)
+        title_elem = title_elems[0] if title_elems else None
+        link = title_elem.find('.//a') if title_elem is not None else None
+        href = link.get('href') if link is not None else None
+
+        # Walk the .update nodes exactly once; status derives from the
+        # newest update
+        updates = self._parse_updates(incident_elem)
+
         return {
-            'id': link['href'].split('/')[-1] if link and 'href' in link.attrs 
-                 else str(int(datetime.now().timestamp() * 1000)),
-            'name': link.text.strip() if link else 'Unknown Incident',
-            'impact': self._determine_impact_level(title_elem.get('class', []) if title_elem else []),
-            'status': self._parse_updates(incident_elem)[0]['status'] if self._parse_updates(incident_elem) else 'investigating',
-            'updates': self._parse_updates(incident_elem)
+            'id': href.split('/')[-1] if href
+                 else str(time.time_ns() // 1_000_000),
+            'name': link.text_content().strip() if link is not None else 'Unknown Incident',
+            'impact': self._determine_impact_level(title_elem.get('class') or '' if title_elem is not None else ''),
+            'status': updates[0]['status'] if updates else 'investigating',
+            'updates': updates
         }
 
-    def _determine_impact_level(self, title_classes: List[str]) -> str:
-        """Determine incident impact level from CSS classes."""
-        impact_map = {
-            'impact-minor': 'minor',
-            'impact-major': 'major',
-            'impact-critical': 'critical'
-        }
-        
-        title_class = ' '.join(title_classes).lower()
-        return next((level for key, level in impact_map.items() 
-                    if key in title_class), 'none')
+    def _determine_impact_level(self, title_class: str) -> str:
+        """Determine incident impact level from the CSS class attribute."""
+        for token in title_class.lower().split():
+            impact = _IMPACT_BY_TOKEN.get(token)
+            if impact is None and 'impact' in token:
+                # BEM-style "incident-title--impact-minor" variants
+                impact = _IMPACT_BY_TOKEN.get('impact-' + token.rsplit('-', 1)[-1])
+            if impact:
+                return impact
+        return 'none'
 
-    def _parse_updates(self, incident_elem: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _parse_updates(self, incident_elem: lxml_html.HtmlElement) -> List[Dict[str, Any]]:
         """Parse incident updates."""
         updates = []
-        
-        for update_elem in incident_elem.select(self._selectors['incident']['update']):
-            strong = update_elem.find('strong')
-            message = update_elem.select_one(self._selectors['incident']['message'])
-            small = update_elem.find('small')
-            
-            if strong and message and small:
+
+        message_sel = self._SEL_INCIDENT_MESSAGE
+        for update_elem in self._SEL_INCIDENT_UPDATE(incident_elem):
+            strong = update_elem.find('.//strong')
+            messages = message_sel(update_elem)
+            small = update_elem.find('.//small')
+
+            if strong is not None and messages and small is not None:
                 updates.append({
-                    'status': strong.text.strip().lower(),
-                    'message': message.text.strip(),
+                    'status': sys.intern(strong.text_content().strip().lower()),
+                    'message': messages[0].text_content().strip(),
                     'timestamp': self._parse_timestamp(self._extract_date_info(small))
                 })
-        
+
         return updates
 
-    def _extract_date_info(self, small_elem: BeautifulSoup) -> str:
+    def _extract_date_info(self, small_elem: lxml_html.HtmlElement) -> str:
         """Extract and format date information."""
-        date_selectors = self._selectors['incident']['date']
-        month = small_elem.text.strip().split()[0]
-        day = small_elem.select_one(date_selectors['day'])
-        time = small_elem.select_one(date_selectors['time'])
-        year = small_elem.select_one(date_selectors['year'])
-        
-        return (f"{month} {day.text.strip() if day else ''}, "
-                f"{year.text.strip() if year else datetime.now().year} "
-                f"{time.text.strip() if time else ''}")
+        # Fast path: one regex scan over the flattened text
+        match = _DATE_RE.search(' '.join(small_elem.text_content().split()))
+        if match:
+            month, day, year, hour, minute, meridiem = match.groups()
+            return f"{month} {day}, {year} {hour}:{minute} {meridiem}"
+
+        # Fall back to the per-field selectors when the text deviates
+        month = small_elem.text_content().strip().split()[0]
+        days = self._SEL_DATE_DAY(small_elem)
+        times = self._SEL_DATE_TIME(small_elem)
+        years = self._SEL_DATE_YEAR(small_elem)
+
+        return (f"{month} {days[0].text_content().strip() if days else ''}, "
+                f"{years[0].text_content().strip() if years else datetime.now().year} "
+                f"{times[0].text_content().strip() if times else ''}")
 
     def _parse_timestamp(self, timestamp_str: str) -> str:
         """Parse timestamp string to ISO format."""
         try:
-            # Assuming PST timezone for consistency with original
-            dt = datetime.strptime(f"{timestamp_str} PST", "%B %d, %Y %I:%M %p %Z")
-            return dt.isoformat()
+            # Timestamps are PST on the page; parsed naive for consistency
+            return _parse_timestamp_cached(timestamp_str)
         except Exception:
-            return datetime.utcnow().isoformat()
+            return _now_iso()
+
+    def _save_previous_state(self, force: bool = False) -> None:
+        """Persist the previous state via the shared store."""
+        if self._previous_state is None:
+            return
+        self._store.set('last_status', self._previous_state, force=force)
+
+    def flush_state(self) -> None:
+        """Force any pending state write, e.g. on shutdown."""
+        self._store.flush()
 
     def get_current_state(self) -> Optional[Dict[str, Any]]:
         """Get the current state."""
@@ -199,30 +369,28 @@ class StatusChecker:
     def _is_duplicate(self, message: str, timestamp: str) -> bool:
         """Check if a message is a duplicate within the expiry window."""
         key = f"{message}-{timestamp}"
-        now = datetime.now().timestamp() * 1000
-        
-        # Clean up old messages
-        if len(self._recent_messages) > 0 and len(self._recent_messages) % 100 == 0:
-            expired_time = now - self._MESSAGE_EXPIRY
-            self._recent_messages = {
-                k: v for k, v in self._recent_messages.items()
-                if v >= expired_time
-            }
-        
-        # Limit dictionary size
-        if len(self._recent_messages) > 1000:
-            oldest_key = min(self._recent_messages, key=self._recent_messages.get)
-            del self._recent_messages[oldest_key]
-        
-        if key in self._recent_messages:
-            return True
-        
-        self._recent_messages[key] = now
+        # Monotonic: expiry windows are immune to wall-clock steps, and
+        # the call skips datetime construction entirely
+        now = time.monotonic()
+
+        recent = self._recent_messages
+        seen_at = recent.get(key)
+        if seen_at is not None:
+            if now - seen_at < self._MESSAGE_EXPIRY:
+                recent.move_to_end(key)
+                return True
+            # Expired entry: fall through and re-record it
+
+        if len(recent) >= self._MAX_RECENT_MESSAGES:
+            recent.popitem(last=False)
+
+        recent[key] = now
+        recent.move_to_end(key)
         return False
 
     async def check_for_updates(self) -> Optional[List[Dict[str, Any]]]:
         """Check for status updates and return changes."""
-        current_state = self.fetch_status()
+        current_state = await self.fetch_status()
         
         if not current_state:
             logger.warning("Failed to fetch status update")
@@ -232,6 +400,8 @@ class StatusChecker:
 
         if not self._previous_state:
             self._previous_state = current_state
+            # Persistence does blocking file I/O; keep it off the event loop
+            await asyncio.to_thread(self._save_previous_state)
             status_msg = (
                 f"Status monitoring initialized.\n"
                 f"Current Status: {current_state['overall']['description']}\n"
@@ -246,6 +416,7 @@ class StatusChecker:
 
         updates = self._compare_states(self._previous_state, current_state)
         self._previous_state = current_state
+        await asyncio.to_thread(self._save_previous_state)
 
         return updates if updates else None
 
@@ -270,10 +441,14 @@ class StatusChecker:
                     'level': current['overall']['level']
                 })
 
-        # Check component changes
+        # Check component changes; the (name, status) set difference finds
+        # changed and new components in C, and the follow-up loop keeps
+        # page order for the ones that differ
+        cur_statuses = {name: data['status'] for name, data in current['components'].items()}
+        prev_statuses = {name: data.get('status') for name, data in previous['components'].items()}
+        changed_components = {name for name, _ in cur_statuses.items() - prev_statuses.items()}
         for component, current_status in current['components'].items():
-            prev_status = previous['components'].get(component)
-            if not prev_status or prev_status['status'] != current_status['status']:
+            if component in changed_components:
                 message = f"{component} status changed to: {current_status['status']}"
                 if not self._is_duplicate(message, current_status['timestamp']):
                     updates.append({
@@ -283,28 +458,27 @@ class StatusChecker:
                         'component': component
                     })
 
-        # Check incident changes
+        # Check incident changes; id-keyed dicts make each lookup O(1)
+        # instead of a scan over the previous incident list
         if current['incidents']:
+            prev_by_id = {i['id']: i for i in previous['incidents']}
             current_ids = {i['id'] for i in current['incidents']}
-            previous_ids = {i['id'] for i in previous['incidents']}
 
             # New and updated incidents
             for incident in current['incidents']:
-                prev_incident = next((i for i in previous['incidents'] 
-                                    if i['id'] == incident['id']), None)
-                
-                if incident['id'] not in previous_ids:
+                prev_incident = prev_by_id.get(incident['id'])
+
+                if prev_incident is None:
                     updates.append({'type': 'new_incident', 'incident': incident})
-                elif prev_incident and (
+                elif (
                     prev_incident['status'] != incident['status'] or
                     len(prev_incident['updates']) != len(incident['updates'])
                 ):
                     updates.append({'type': 'incident_update', 'incident': incident})
 
             # Resolved incidents
-            for prev_id in previous_ids - current_ids:
-                resolved_incident = next(i for i in previous['incidents'] 
-                                      if i['id'] == prev_id)
+            for prev_id in prev_by_id.keys() - current_ids:
+                resolved_incident = prev_by_id[prev_id]
                 if resolved_incident:
                     updates.append({
                         'type': 'incident_resolved',
@@ -315,7 +489,7 @@ class StatusChecker:
                                 {
                                     'status': 'resolved',
                                     'message': 'Incident resolved',
-                                    'timestamp': datetime.utcnow().isoformat()
+                                    'timestamp': _now_iso()
                                 },
                                 *resolved_incident['updates']
                             ]
@@ -1,52 +1,144 @@
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, Any
 from discord import Embed
 
-STATUS_COLORS = {
+class _Colors(dict):
+    """Status → embed color with the default folded into __missing__.
+
+    A plain subscript is then a single dict operation; no second lookup
+    to evaluate the fallback argument of .get().
+    """
+
+    def __missing__(self, key):
+        return 0x95A5A6
+
+STATUS_COLORS = _Colors({
     "operational": 0x2ECC71,
     "degraded": 0xF1C40F,
     "outage": 0xE74C3C,
     "maintenance": 0x3498DB,
     "default": 0x95A5A6
-}
+})
 
+# Footer divider is constant; only the clock after it changes per render
+_FOOTER_PREFIX = "─────────────\nLast Updated • "
+
+@lru_cache(maxsize=128)
 def format_name(name: str) -> str:
     """Format component name for display."""
     return name.lower().replace("- beta features", "(beta)")
 
+@lru_cache(maxsize=128)
 def format_status(status: str) -> str:
     """Format status text for display."""
     return status.lower()
 
+# Exact-match dispatch for the closed status vocabulary; one dict hit
+# replaces the substring scans for every status the feed actually emits.
+# "●" marks healthy states, "○" everything impaired or unknown
+_STATUS_DOTS = {
+    "operational": "●",
+    "maintenance": "●",
+    "under maintenance": "●",
+    "resolved": "●",
+    "degraded": "○",
+    "degraded performance": "○",
+    "partial outage": "○",
+    "major outage": "○",
+    "outage": "○",
+}
+
+# Second-level lookup on the first token covers free-form variants
+# ("degraded performance on ...") without substring scans
+_STATUS_DOTS_BY_TOKEN = {
+    status.split(' ', 1)[0]: dot for status, dot in _STATUS_DOTS.items()
+}
+
+@lru_cache(maxsize=128)
 def get_status_dot(status: str) -> str:
-    """Get status indicator dot using colored circle emojis."""
+    """Get status indicator dot ("●" healthy, "○" otherwise)."""
     status_lower = status.lower()
-    if any(s in status_lower for s in ["operational"]):
-        return "🟢"  # Green circle for operational
-    elif any(s in status_lower for s in ["degraded"]):
-        return "🟡"  # Yellow circle for degraded
-    elif any(s in status_lower for s in ["outage"]):
-        return "🔴"  # Red circle for outage
-    elif any(s in status_lower for s in ["maintenance", "resolved"]):
-        return "🔵"  # Blue circle for maintenance/resolved
-    else:
-        return "⚪"  # White circle for unknown/default
+    dot = _STATUS_DOTS.get(status_lower)
+    if dot is not None:
+        return dot
+    return _STATUS_DOTS_BY_TOKEN.get(status_lower.split(' ', 1)[0], "○")
+
+# Incident impact ordering for the active incidents field, hoisted to
+# module scope so the sort key is a bound dict.get with no per-render
+# dict construction
+_PRIORITY_MAP = {'critical': 3, 'major': 2, 'minor': 1, 'none': 0}
+_get_priority = _PRIORITY_MAP.get
+
+def _format_clock(dt: datetime) -> str:
+    """Format a 12-hour clock ("04:47 PM") without going through strftime.
+
+    The formats used here are fixed and non-localized, so direct attribute
+    formatting skips strftime's locale machinery.
+    """
+    return f"{dt.hour % 12 or 12:02d}:{dt.minute:02d} {'PM' if dt.hour >= 12 else 'AM'}"
+
+@lru_cache(maxsize=256)
+def _format_update_timestamp(timestamp: str) -> str:
+    """Render an update's ISO timestamp for display, cached per string.
+
+    The same incident renders on every poll, so the fromisoformat +
+    formatting work is done once per unique timestamp instead of per render.
+    """
+    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    return (f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+            f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d} UTC")
+
+# Last rendered status embed keyed by the fields it actually displays;
+# unchanged polls reuse it instead of rebuilding every field
+_last_render_key = None
+_last_render_embed = None
+
+def _status_embed_key(status: Dict[str, Any]) -> tuple:
+    return (
+        status['overall']['level'],
+        status['overall']['description'],
+        tuple((name, data['status'])
+              for name, data in status['components'].items()),
+        tuple((incident.get('id', ''), incident.get('status', ''))
+              for incident in status.get('incidents', []))
+    )
 
 def create_status_embed(status: Dict[str, Any]) -> Embed:
-    """Create status overview embed."""
-    now = datetime.utcnow()
+    """Create status overview embed, reusing the last render if unchanged."""
+    global _last_render_key, _last_render_embed
+    key = _status_embed_key(status)
+    if key == _last_render_key:
+        embed = _last_render_embed.copy()
+        # Only the footer clock moves between identical renders
+        embed.set_footer(
+            text=_FOOTER_PREFIX + _format_clock(datetime.now(timezone.utc))
+        )
+        return embed
+
+    embed = _build_status_embed(status)
+    _last_render_key = key
+    _last_render_embed = embed
+    return embed.copy()
+
+def _build_status_embed(status: Dict[str, Any]) -> Embed:
+    """Build the status overview embed from scratch."""
+    now = datetime.now(timezone.utc)
     status_level = status['overall']['level']
     embed = Embed(
         title="☀️ Anthropic Status",
         description=f"{get_status_dot(status['overall']['description'])} {format_status(status['overall']['description'])}",
-        color=STATUS_COLORS.get(status_level, STATUS_COLORS['default'])
+        color=STATUS_COLORS[status_level]
     )
 
-    # Add component statuses with proper spacing
-    components_text = []
-    for name, data in status['components'].items():
-        components_text.append(f"{get_status_dot(data['status'])} {format_name(name)}\n└─ {format_status(data['status'])}")
-    
+    # Add component statuses with proper spacing; the lowercased status
+    # is computed once per component and shared by dot and display
+    components_text = [
+        f"{get_status_dot(comp_status)} {format_name(name)}\n└─ {comp_status}"
+        for name, data in status['components'].items()
+        for comp_status in (data['status'].lower(),)
+    ]
+
     if components_text:
         embed.add_field(
             name="components",
@@ -54,28 +146,57 @@ def create_status_embed(status: Dict[str, Any]) -> Embed:
             inline=False
         )
     
+    # List unresolved incidents, most severe first
+    active_incidents = [
+        incident for incident in status.get('incidents', [])
+        if incident.get('status') != 'resolved'
+    ]
+    if active_incidents:
+        active_incidents.sort(key=lambda i: _get_priority(i.get('impact', 'none'), 0), reverse=True)
+        incidents_text = [
+            f"{get_status_dot(inc_status)} {format_status(incident.get('name', ''))}\n"
+            f"└─ status: {inc_status}"
+            for incident in active_incidents
+            for inc_status in (incident.get('status', '').lower(),)
+        ]
+        embed.add_field(
+            name="active incidents",
+            value="\n\n".join(incidents_text),
+            inline=False
+        )
+
     # Set footer with divider and timestamp
-    embed.set_footer(text=f"─────────────\nLast Updated • {now.strftime('%I:%M %p')}")
+    embed.set_footer(text=_FOOTER_PREFIX + _format_clock(now))
 
     return embed
 
+def create_change_digest_embed(changes: list) -> Embed:
+    """Create one digest embed summarizing buffered status changes."""
+    embed = Embed(
+        title="status changes",
+        description="\n".join(f"• {change['message']}" for change in changes),
+        color=STATUS_COLORS[changes[-1].get('level', 'default')]
+    )
+    embed.timestamp = datetime.now(timezone.utc)
+    return embed
+
 def create_incident_embed(incident: Dict[str, Any]) -> Embed:
     """Create incident details embed."""
     embed = Embed(
         title=format_status(incident['name']),
         description=f"impact: {format_status(incident['impact'])}\n{get_status_dot(incident['status'])} status: {format_status(incident['status'])}",
-        color=STATUS_COLORS.get(incident['impact'], STATUS_COLORS['default'])
+        color=STATUS_COLORS[incident['impact']]
     )
-    embed.timestamp = datetime.utcnow()
+    embed.timestamp = datetime.now(timezone.utc)
 
     # Add updates if available
     if incident.get('updates'):
-        updates_text = "\n\n".join(
+        updates_text = "\n\n".join([
             f"{get_status_dot(update['status'])} {format_status(update['status'])}\n"
-            f"    {datetime.fromisoformat(update['timestamp'].replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+            f"    {_format_update_timestamp(update['timestamp'])}\n"
             f"    {update['message']}"
             for update in incident['updates']
-        )
+        ])
         embed.add_field(name="updates", value=updates_text, inline=False)
 
     return embed
\ No newline at end of file
@@ -0,0 +1,97 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import logging
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# orjson serializes the nested state dicts several times faster than the
+# stdlib and emits bytes directly; fall back to json if it is missing
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is in requirements
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True).encode('utf-8')
+
+    _loads = json.loads
+
+class StateStore:
+    """Single combined JSON state file with atomic, change-gated writes.
+
+    Holds everything the bot persists (status message id, last parsed
+    status) in one blob so a save is one tmp-write + os.replace instead
+    of one file per field, and the fields can never drift out of sync.
+    """
+
+    # Minimum seconds between writes during steady operation; forced
+    # saves (rare fields, shutdown flush) ignore it
+    _WRITE_DEBOUNCE = 10.0
+
+    def __init__(self, path: str = 'bot_state.json'):
+        self._path = path
+        self._data: Dict[str, Any] = {}
+        self._hash: Optional[bytes] = None
+        self._last_write = 0.0
+        # Saves arrive from several to_thread workers (check loop,
+        # dispatch loop, shutdown flush); serialize them so _data is
+        # never mutated mid-dump and the tmp file is written by one
+        # thread at a time
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        # Fresh start has no state file; skip the open/except machinery
+        if not os.path.isfile(self._path):
+            return
+        try:
+            with open(self._path, 'rb') as f:
+                self._data = _loads(f.read())
+            # Prime the hash so an immediate save of identical state is a no-op
+            payload = _dumps(self._data)
+            self._hash = hashlib.blake2b(payload, digest_size=16).digest()
+        except ValueError:
+            self._data = {}
+        except Exception as error:
+            logger.warning(f"Failed to load persisted state: {error}")
+            self._data = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def set(self, key: str, value: Any, force: bool = False) -> None:
+        """Set a field and persist, skipping unchanged or rapid writes."""
+        with self._lock:
+            self._data[key] = value
+            self._save(force=force)
+
+    def _save(self, force: bool = False) -> None:
+        # Caller holds self._lock
+        payload = _dumps(self._data)
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if digest == self._hash:
+            return
+        if not force and time.monotonic() - self._last_write < self._WRITE_DEBOUNCE:
+            return
+
+        try:
+            tmp_path = f"{self._path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self._path)
+            self._hash = digest
+            self._last_write = time.monotonic()
+        except OSError as error:
+            logger.warning(f"Failed to persist state: {error}")
+
+    def flush(self) -> None:
+        """Force any pending write, e.g. on shutdown."""
+        with self._lock:
+            self._save(force=True)
@@ -6,7 +6,6 @@ Combines process management and Python path setup in a single file.
 
 import os
 import sys
-import subprocess
 
 def setup_python_path():
     """Add src directory to Python path."""